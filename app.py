@@ -2,6 +2,8 @@ import streamlit as st
 import PyPDF2
 import textstat
 import re
+import io
+import pymupdf
 
 st.set_page_config(
     page_title="PDF Suggester 🎉",
@@ -15,31 +17,77 @@ st.image("https://static.boredpanda.com/blog/wp-content/uploads/2017/12/funny-jo
 st.title("📄 PDF Suggester 🤖✨")
 st.markdown("Upload a PDF and let our *friendly robot* suggest improvements 🐱‍👤")
 
+
+def _extract_with_pypdf2(file_bytes: bytes) -> str:
+    reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
+    return "".join(page.extract_text() or "" for page in reader.pages)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def extract_text_from_pdf(file_bytes: bytes) -> str:
+    try:
+        with pymupdf.open(stream=file_bytes, filetype="pdf") as doc:
+            return "".join(page.get_text("text") for page in doc)
+    except (pymupdf.FileDataError, ValueError):
+        # MuPDF rejected the file (unreadable or encrypted); let PyPDF2 try
+        return _extract_with_pypdf2(file_bytes)
+
+
+# All whole-text heuristics in one alternation, so the text is scanned once
+ISSUE_RE = re.compile(
+    r"(?P<filler>\b(?:very|really|just|basically)\b)"
+    r"|(?P<passive>\b(?:is|was|were|be|been|being)\b\s+\w+ed)"
+)
+ISSUE_KINDS = frozenset(ISSUE_RE.groupindex)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def find_issue_kinds(text: str) -> set:
+    found = set()
+    for m in ISSUE_RE.finditer(text):
+        found.add(m.lastgroup)
+        if found == ISSUE_KINDS:
+            break
+    return found
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def readability_score(text: str) -> float:
+    # Flesch Reading Ease from base counts taken once each, rather than
+    # letting textstat re-count words for both of its averages
+    n_words = textstat.lexicon_count(text)
+    n_sentences = textstat.sentence_count(text)
+    n_syllables = textstat.syllable_count(text)
+    if not (n_words and n_sentences and n_syllables):
+        return 0.0
+    return 206.835 - 1.015 * (n_words / n_sentences) - 84.6 * (n_syllables / n_words)
+
+
 uploaded_file = st.file_uploader("👉 Drop your PDF here", type="pdf")
 
 if uploaded_file is not None:
-    # Extract text
-    reader = PyPDF2.PdfReader(uploaded_file)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() or ""
+    # Extract text (cached on the file contents, so reruns skip the parse)
+    with st.spinner("🔍 Reading your PDF..."):
+        text = extract_text_from_pdf(uploaded_file.getvalue())
     
     st.subheader("📚 Extracted Text")
     st.write(text[:500] + "...")  # Show first 500 chars
     
     # Readability
-    score = textstat.flesch_reading_ease(text)
+    with st.spinner("🧮 Crunching readability..."):
+        score = readability_score(text)
     st.subheader("📊 Readability Score")
     st.metric("Flesch Reading Ease", f"{score:.2f}")
     
     # Issues
     st.subheader("⚠️ Suggested Fixes")
     issues = []
+    found = find_issue_kinds(text)
     if score < 50:
         issues.append("Your text is *too complex*. Try using shorter sentences.")
-    if re.search(r"\b(very|really|just|basically)\b", text):
+    if "filler" in found:
         issues.append("Too many filler words like *very/really*. Keep it sharp!")
-    if re.search(r"\b(is|was|were|be|been|being)\b\s+\w+ed", text):
+    if "passive" in found:
         issues.append("Detected **passive voice**. Use active voice instead.")
     
     if issues: